@@ -13,7 +13,7 @@ from typing import Optional
 
 from sqlalchemy.orm import Session, sessionmaker
 
-from api.database import Feature
+from api.database import Feature, bulk_insert_features
 
 
 def migrate_json_to_sqlite(
@@ -71,22 +71,22 @@ def migrate_json_to_sqlite(
     # Import features into database
     session = session_maker()
     try:
-        imported_count = 0
-        for i, feature_dict in enumerate(features_data):
-            # Handle both old format (no id/priority/name) and new format
-            feature = Feature(
-                id=feature_dict.get("id", i + 1),
-                priority=feature_dict.get("priority", i + 1),
-                category=feature_dict.get("category", "uncategorized"),
-                name=feature_dict.get("name", f"Feature {i + 1}"),
-                description=feature_dict.get("description", ""),
-                steps=feature_dict.get("steps", []),
-                passes=feature_dict.get("passes", False),
-                in_progress=feature_dict.get("in_progress", False),
-                dependencies=feature_dict.get("dependencies"),
-            )
-            session.add(feature)
-            imported_count += 1
+        # Handle both old format (no id/priority/name) and new format
+        rows = [
+            {
+                "id": feature_dict.get("id", i + 1),
+                "priority": feature_dict.get("priority", i + 1),
+                "category": feature_dict.get("category", "uncategorized"),
+                "name": feature_dict.get("name", f"Feature {i + 1}"),
+                "description": feature_dict.get("description", ""),
+                "steps": feature_dict.get("steps", []),
+                "passes": feature_dict.get("passes", False),
+                "in_progress": feature_dict.get("in_progress", False),
+                "dependencies": feature_dict.get("dependencies"),
+            }
+            for i, feature_dict in enumerate(features_data)
+        ]
+        bulk_insert_features(session, rows)
 
         session.commit()
 
@@ -614,7 +614,7 @@ def feature_create_bulk(
                 if indices:
                     # Convert indices to actual feature IDs
                     dep_ids = [created_features[idx].id for idx in indices]
-                    created_features[i].dependencies = sorted(dep_ids)  # type: ignore[assignment]  # SQLAlchemy JSON Column accepts list at runtime
+                    created_features[i].dependencies = sorted(dep_ids)
                     deps_count += 1
 
             # Commit happens automatically on context manager exit
@@ -29,6 +29,20 @@ _RATE_LIMIT_REGEX = re.compile(
     re.IGNORECASE
 )
 
+# Retry-after regex: a single alternation so messages are scanned once.
+# The seconds value must be followed by an explicit "seconds"/"s" unit OR by the
+# end of the string/sentence. This prevents matching "30 minutes" or "1 hour".
+_RETRY_AFTER_REGEX = re.compile(
+    r"(?:retry.?after[:\s]+|try again in\s+)(\d+)(?:\s*(?:seconds?|s\b)|\s*$|\s*[,.])"
+    r"|(\d+)\s*seconds?\s*(?:remaining|left|until)",
+    re.IGNORECASE
+)
+
+# Base rate limit backoff per retry count: min(15 * 2^retries, 3600).
+# The cap is reached at retry 8, so later retries reuse the last entry.
+_RATE_LIMIT_BACKOFF_BASES = tuple(min(15 * (1 << retries), 3600) for retries in range(9))
+
+
 
 def parse_retry_after(error_message: str) -> Optional[int]:
     """
@@ -46,20 +60,9 @@ def parse_retry_after(error_message: str) -> Optional[int]:
     Returns:
         Seconds to wait, or None if not parseable.
     """
-    # Patterns require explicit "seconds" or "s" unit, OR no unit at all (end of string/sentence)
-    # This prevents matching "30 minutes" or "1 hour" since those have non-seconds units
-    patterns = [
-        r"retry.?after[:\s]+(\d+)\s*(?:seconds?|s\b)",  # Requires seconds unit
-        r"retry.?after[:\s]+(\d+)(?:\s*$|\s*[,.])",     # Or end of string/sentence
-        r"try again in\s+(\d+)\s*(?:seconds?|s\b)",     # Requires seconds unit
-        r"try again in\s+(\d+)(?:\s*$|\s*[,.])",        # Or end of string/sentence
-        r"(\d+)\s*seconds?\s*(?:remaining|left|until)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, error_message, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
+    match = _RETRY_AFTER_REGEX.search(error_message)
+    if match:
+        return int(match.group(1) or match.group(2))
 
     return None
 
@@ -77,7 +80,7 @@ def is_rate_limit_error(error_message: str) -> bool:
     Returns:
         True if the message indicates a rate limit, False otherwise.
     """
-    return bool(_RATE_LIMIT_REGEX.search(error_message))
+    return _RATE_LIMIT_REGEX.search(error_message) is not None
 
 
 def calculate_rate_limit_backoff(retries: int) -> int:
@@ -98,7 +101,7 @@ def calculate_rate_limit_backoff(retries: int) -> int:
     Returns:
         Delay in seconds (clamped to 1-3600 range, with jitter)
     """
-    base = int(min(max(15 * (2 ** retries), 1), 3600))
+    base = _RATE_LIMIT_BACKOFF_BASES[min(max(retries, 0), len(_RATE_LIMIT_BACKOFF_BASES) - 1)]
     jitter = random.uniform(0, base * 0.3)
     return int(base + jitter)
 
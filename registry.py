@@ -16,7 +16,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import Column, DateTime, Integer, String, create_engine, text
+from sqlalchemy import Column, DateTime, Integer, String, create_engine, inspect, text
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 # Module logger
@@ -182,25 +182,23 @@ def _get_engine():
                         "timeout": SQLITE_TIMEOUT,
                     }
                 )
-                Base.metadata.create_all(bind=_engine)
-                _migrate_add_default_concurrency(_engine)
+                with _engine.begin() as conn:
+                    Base.metadata.create_all(bind=conn)
+                    _migrate_add_default_concurrency(conn)
                 _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
                 logger.debug("Initialized registry database at: %s", db_path)
 
     return _engine, _SessionLocal
 
 
-def _migrate_add_default_concurrency(engine) -> None:
+def _migrate_add_default_concurrency(conn) -> None:
     """Add default_concurrency column if missing (for existing databases)."""
-    with engine.connect() as conn:
-        result = conn.execute(text("PRAGMA table_info(projects)"))
-        columns = [row[1] for row in result.fetchall()]
-        if "default_concurrency" not in columns:
-            conn.execute(text(
-                "ALTER TABLE projects ADD COLUMN default_concurrency INTEGER DEFAULT 3"
-            ))
-            conn.commit()
-            logger.info("Migrated projects table: added default_concurrency column")
+    columns = {c["name"] for c in inspect(conn).get_columns("projects")}
+    if "default_concurrency" not in columns:
+        conn.execute(text(
+            "ALTER TABLE projects ADD COLUMN default_concurrency INTEGER DEFAULT 3"
+        ))
+        logger.info("Migrated projects table: added default_concurrency column")
 
 
 @contextmanager
@@ -177,6 +177,12 @@ class TestBackoffFunctions(unittest.TestCase):
             max_with_jitter = int(base * 1.3)
             assert delay <= max_with_jitter, f"Retry {retries}: {delay} > max {max_with_jitter}"
 
+    def test_rate_limit_backoff_caps_large_retries(self):
+        """Test that retry counts past the cap stay within [3600, 3600 * 1.3]."""
+        for retries in (8, 20, 100):
+            delay = calculate_rate_limit_backoff(retries)
+            assert 3600 <= delay <= int(3600 * 1.3), f"Retry {retries}: {delay} out of range"
+
     def test_error_backoff_sequence(self):
         """Test that error backoff follows expected linear sequence."""
         expected = [30, 60, 90, 120, 150, 180, 210, 240, 270, 300, 300]  # Caps at 300